@@ -8,14 +8,18 @@ Structure: SQLITE3
 from .utils import (
     Mento,
     PrimaryKey,
+    ShardKey,
+    FullText,
     Column,
     Fetch,
     UniqueMatch,
     MentoExceptions,
     Static,
     AutoResponse,
+    MaterializedView,
 )
 from .connection import MentoConnection
+from .sharding import ShardedMento
 from .models import DefaultModel
 from pydantic import BaseModel
 from pydantic.dataclasses import dataclass
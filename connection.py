@@ -1,12 +1,42 @@
 from sqlite3 import connect
+from pathlib import Path
+from tempfile import mkstemp
+import os
 import sqlite3
 
+# Large enough for most analytics tables, sqlite caps it by SQLITE_MAX_MMAP_SIZE.
+SNAPSHOT_MMAP_SIZE = 1 << 30
+
 
 class MentoConnection:
-    def __init__(self, database: str = "./database.db", check_same_thread=False):
-        self.connection: sqlite3.Connection = connect(
-            database=database, check_same_thread=check_same_thread
-        )
+    def __init__(
+        self,
+        database: str = "./database.db",
+        check_same_thread=False,
+        read_only: bool = False,
+        immutable: bool = False,
+        mmap_size: int = 0,
+    ):
+        """A sqlite3 connection. read_only opens database with a `mode=ro` URI (reads still take SHARED locks, so writers
+        can hit `database is locked` during long scans unless the database uses WAL), immutable also skips locking
+        (only for files nobody writes), mmap_size serves reads from memory-mapped pages."""
+        if immutable and not read_only:
+            raise BaseException("Immutable connections must be opened with read_only=True.")
+        self.database = database
+        self.read_only = read_only
+        if read_only:
+            uri = f"{Path(database).resolve().as_uri()}?mode=ro"
+            if immutable:
+                uri += "&immutable=1"
+            self.connection: sqlite3.Connection = connect(
+                database=uri, check_same_thread=check_same_thread, uri=True
+            )
+        else:
+            self.connection: sqlite3.Connection = connect(
+                database=database, check_same_thread=check_same_thread
+            )
+        if mmap_size:
+            self.connection.execute(f"PRAGMA mmap_size = {int(mmap_size)}")
 
     def cursor(self):
         return self.connection.cursor()
@@ -22,3 +52,55 @@ class MentoConnection:
         if auto_commit:
             self.commit()
         return _exec_query
+
+    def executemany(
+        self, query: str, parameters: "list[tuple]", auto_commit: bool = True
+    ) -> "sqlite3.Cursor":
+        _exec_query = self.cursor().executemany(query, parameters)
+        if auto_commit:
+            self.commit()
+        return _exec_query
+
+    def rollback(self):
+        self.connection.rollback()
+
+    def snapshot(
+        self,
+        path: str = None,
+        mmap_size: int = SNAPSHOT_MMAP_SIZE,
+        check_same_thread=False,
+    ) -> "MentoConnection":
+        """Take a consistent copy of the database with the sqlite backup API and open it read-only.
+        With a path, the copy is written there and reopened as immutable and memory-mapped; without one it stays in memory.
+        The copy is written to a temporary file and renamed over path, so readers of an older snapshot keep their file.
+        Any transaction open on this connection is committed first, so the snapshot includes its changes."""
+        self.commit()
+        if not path:
+            snapshot = MentoConnection(":memory:", check_same_thread=check_same_thread)
+            self.connection.backup(snapshot.connection)
+            snapshot.connection.execute("PRAGMA query_only = ON")
+            snapshot.read_only = True
+            return snapshot
+
+        descriptor, temporary = mkstemp(
+            dir=os.path.dirname(os.path.abspath(path)), suffix=".snapshot"
+        )
+        os.close(descriptor)
+        try:
+            target = connect(temporary)
+            try:
+                self.connection.backup(target)
+            finally:
+                target.close()
+            os.replace(temporary, path)
+        except BaseException:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+        return MentoConnection(
+            path,
+            check_same_thread=check_same_thread,
+            read_only=True,
+            immutable=True,
+            mmap_size=mmap_size,
+        )
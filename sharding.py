@@ -0,0 +1,248 @@
+import heapq
+import threading
+import zlib
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from inspect import signature
+from typing import Any, Callable
+from pydantic import BaseModel
+from .connection import MentoConnection
+from .models import DefaultModel
+from .utils import Mento, Column, Static, Lambda, order_key, order_terms
+
+
+class ShardedMento:
+    def __init__(
+        self,
+        databases: list[str],
+        default_table: str = None,
+        check_model: BaseModel = None,
+        shard_key: str = None,
+        ranges: list = None,
+        error_logging: bool = False,
+    ):
+        """A logical database partitioned across many sqlite files, every file has its own connection.
+        Rows are routed by the model's ShardKey column (or shard_key) with a stable hash,
+        or by ranges (sorted inclusive upper bounds, one less than databases) for range partitioning."""
+        if ranges and len(ranges) != len(databases) - 1:
+            raise BaseException("Ranges must have one bound less than databases.")
+        self.connections = [
+            MentoConnection(database, check_same_thread=False) for database in databases
+        ]
+        self.shards = [
+            Mento(connection, default_table, check_model, error_logging)
+            for connection in self.connections
+        ]
+        self.locks = [threading.Lock() for _ in self.shards]
+        self.executor = ThreadPoolExecutor(max_workers=len(self.shards))
+        self.default_table = default_table
+        self.check_model = check_model
+        self.ranges = ranges
+        self.shard_key = shard_key
+        self.shard_keys = dict()
+        self.exceptions = self.shards[0].exceptions
+
+    def model_shard_key(self, model: BaseModel = None) -> "str | None":
+        """Returns the column declared as ShardKey on model."""
+        if not model:
+            return None
+        for param in signature(model).parameters.values():
+            column = Column(str(param))
+            if column.is_shard_key:
+                return column.name
+        return None
+
+    def key_of(self, table: str = None) -> str:
+        key = (
+            self.shard_key
+            or self.shard_keys.get(table)
+            or self.model_shard_key(self.check_model)
+        )
+        if not key:
+            raise BaseException(
+                f"Table `{table}` has no shard key. Please use ShardKey in your model or set shard_key."
+            )
+        return key
+
+    def shard_of(self, value: Any) -> int:
+        """Returns the shard index of a shard key value."""
+        if self.ranges:
+            return bisect_left(self.ranges, value)
+        return zlib.crc32(str(value).encode()) % len(self.shards)
+
+    def run(self, index: int, job: Callable[[Mento], Any]) -> Any:
+        with self.locks[index]:
+            return job(self.shards[index])
+
+    def fan_out(self, job: Callable[[Mento], Any], indexes: list[int] = None) -> list:
+        """Runs job on every (or given) shard concurrently, results keep shard order."""
+        if indexes is None:
+            indexes = range(len(self.shards))
+        futures = [self.executor.submit(self.run, index, job) for index in indexes]
+        return [future.result() for future in futures]
+
+    def route(self, table: str, where: dict = None) -> "list[int] | None":
+        """Returns the only shard matching where's shard key, or None when every shard is needed."""
+        key = self.key_of(table)
+        if where and key in where:
+            return [self.shard_of(where[key])]
+        return None
+
+    def create(
+        self,
+        table: str = None,
+        model: BaseModel = DefaultModel,
+        exists_check: bool = True,
+        unique_columns: list = [],
+    ):
+        """Create a table with your BaseModel on every shard."""
+        if not table:
+            table = self.default_table
+        if not model:
+            model = self.check_model
+        key = self.model_shard_key(model)
+        if key:
+            self.shard_keys[table] = key
+        self.fan_out(lambda shard: shard.create(table, model, exists_check, unique_columns))
+
+    def drop(self, table: str = None):
+        """Drop table on every shard."""
+        if not table:
+            table = self.default_table
+        self.fan_out(lambda shard: shard.drop(table))
+
+    def insert(
+        self, table: str = None, data: dict = dict(), check_model: BaseModel = None
+    ):
+        """Insert data to the shard of its shard key."""
+        if not table:
+            table = self.default_table
+        key = self.key_of(table)
+        if key not in data:
+            raise BaseException(f"Your data has no shard key named `{key}`")
+        return self.run(
+            self.shard_of(data[key]),
+            lambda shard: shard.insert(table, data, check_model),
+        )
+
+    def insert_many(
+        self, table: str = None, datas: list[dict] = list(), chunk_size: int = 10000
+    ) -> int:
+        """Insert many rows, rows of different shards are written in parallel."""
+        if not table:
+            table = self.default_table
+        if not datas:
+            return 0
+        key = self.key_of(table)
+        columns = list(datas[0].keys())
+        groups = dict()
+        for data in datas:
+            groups.setdefault(self.shard_of(data[key]), list()).append(
+                tuple(data.get(column) for column in columns)
+            )
+        counts = dict()
+        for index, rows in groups.items():
+            counts[index] = self.executor.submit(
+                self.run,
+                index,
+                lambda shard, rows=rows: shard.bulk_insert(
+                    table, columns, rows, chunk_size=chunk_size
+                ),
+            )
+        return sum(count.result() for count in counts.values())
+
+    def update(
+        self,
+        table: str = None,
+        data: dict = None,
+        where: dict = None,
+        update_all: bool = False,
+    ):
+        """Update matched or all columns, on the where's shard or on every shard."""
+        if not table:
+            table = self.default_table
+        if data and self.key_of(table) in data:
+            raise BaseException(
+                "Shard key can't be updated, please delete and insert the row again."
+            )
+        self.fan_out(
+            lambda shard: shard.update(table, data, where, update_all),
+            None if update_all else self.route(table, where),
+        )
+
+    def delete(self, table: str = None, where: dict = dict(), delete_all: bool = False):
+        """Delete matched or all columns, on the where's shard or on every shard."""
+        if not table:
+            table = self.default_table
+        self.fan_out(
+            lambda shard: shard.delete(table, where, delete_all),
+            None if delete_all else self.route(table, where),
+        )
+
+    def select(
+        self,
+        from_table: str = None,
+        model: BaseModel = None,
+        where: dict = None,
+        order_by: Column = None,
+        limit: int = 0,
+        filter: Lambda = None,
+        regexp: dict[str, str | list[str]] = None,
+        select_all: bool = True,
+        select_column: str = None,
+        as_model: bool = False,
+        as_dataframe: bool = False,
+        as_json: bool = False,
+    ):
+        """Select like Mento.select. Without the shard key in where, every shard is queried concurrently
+        and results are merged by order_by (column names with asc/desc) then cut by limit."""
+        if not from_table:
+            from_table = self.default_table
+        if as_model and not model:
+            raise self.exceptions.auto(
+                "If you want to get models you have to specify data model."
+            )
+        indexes = self.route(from_table, where)
+        terms = None
+        if order_by and (indexes is None and len(self.shards) > 1):
+            terms = order_terms(order_by)
+            if terms is None:
+                raise BaseException(
+                    f"order_by `{order_by}` can't be merged across shards, please use column names with asc/desc."
+                )
+        results = self.fan_out(
+            lambda shard: shard.select(
+                from_table,
+                where=where,
+                order_by=order_by,
+                limit=limit,
+                filter=filter,
+                regexp=regexp,
+                select_all=select_all,
+                select_column=select_column,
+            ),
+            indexes,
+        )
+        results = [result for result in results if result]
+        if not select_all and where:
+            matches = results[0] if results else None
+        else:
+            if terms:
+                matches = list(heapq.merge(*results, key=order_key(terms)))
+            else:
+                matches = [data for result in results for data in result]
+            if limit > 0:
+                matches = matches[:limit]
+        response = Static(
+            matches,
+            model=model,
+            as_model=as_model,
+            as_json=as_json,
+            as_dataframe=as_dataframe,
+        )
+        return response.data
+
+    def close(self):
+        self.executor.shutdown()
+        for connection in self.connections:
+            connection.close()
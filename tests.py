@@ -21,6 +21,15 @@ con = MentoConnection("./database/new.db", check_same_thread=False)
 # Then, create a database cursor with connection object.
 cursor = Mento(con)
 
+# Read-only connections can't write; mmap_size serves scans from memory-mapped pages.
+# They still take shared locks while reading, so use WAL or a snapshot to keep readers from blocking writers.
+reader = Mento(MentoConnection("./database/new.db", read_only=True, mmap_size=1 << 30))
+
+# Snapshots take a consistent copy with the sqlite backup API and open it read-only (immutable, memory-mapped),
+# readers of a snapshot never contend with writers. Any open transaction on con is committed first.
+# Without a path the snapshot is kept in memory.
+analytics = Mento(con.snapshot("./database/snapshot.db"))
+
 # Now we created a table looking like (id int, name text, job text, price int)
 cursor.create("sample_table", model=MyModel)
 
@@ -71,6 +80,20 @@ cursor.create("sample", model=Sample, exists_check=False)
 # Creates many table (table_name: TableModel)
 cursor.create_many(dict(first=MyModel, second=PrimaryKeySample, third=Sample))
 
+# CHANGE FEED #
+
+# Records every insert/update/delete (rowid, operation, version, old/new values) into the mento_changes log.
+cursor.create("tracked_sample", model=MyModel, track_changes=True)
+
+# Streams changes newer than a version, oldest first.
+# Sample Output: generator -> {version: 1, rowid: 1, operation: insert, old: None, new: {id: 1, name: fswair, job: developer, price: 4250}}
+cursor.changes("tracked_sample", since=0)
+
+# Aggregates (count, sum, avg) built with one scan, then updated from the change log deltas.
+totals = cursor.materialize("tracked_sample", "sum", column="price", group_by="job")
+totals.refresh()
+totals.value  # {job: sum of price}
+
 # INSERT #
 cursor.insert(
     "sample",
@@ -103,6 +126,44 @@ cursor.select("sample", filter=lambda id: id % 3 == 0)
 # Sample Output: list[dict] -> [{id: 999, name: fswair, age: 18, price: 4250}]
 cursor.select("sample", regexp={"id": ["\d{1,3}"]})
 
+# Splits filter/regexp scans by rowid ranges across 8 worker processes, each worker opens its own read-only connection.
+# Results are merged in rowid (or order_by) order. Filters must be picklable (module level functions, not lambdas);
+# lambdas, in-memory databases and limited selects are scanned serially (a warning is logged).
+def expensive_price(price):
+    return price > 1000
+
+
+# Worker processes may re-import this script (spawn/forkserver), so start the pool from the main guard.
+if __name__ == "__main__":
+    cursor.select("sample", filter=expensive_price, order_by="price desc", workers=8)
+
+# FULL TEXT SEARCH #
+
+
+@dataclass
+class Article(BaseModel):
+    id: PrimaryKey(int)
+    title: FullText(str)
+    body: FullText(str)
+
+
+# Markers nest, a primary key can be full text indexed too.
+@dataclass
+class Page(BaseModel):
+    slug: PrimaryKey(FullText(str))
+    body: FullText(str)
+
+
+# FullText columns are indexed by an FTS5 table (article_fts) kept in sync by triggers.
+cursor.create("article", model=Article)
+cursor.create("page", model=Page)
+
+# Returns rows matched with an FTS5 query, best matches first (rank=True).
+cursor.search("article", "python OR sqlite", limit=10)
+
+# Model Response for search results
+cursor.search("article", "title:mento", model=Article, as_model=True)
+
 # Response Formatters for Select Statement
 
 # JSON Response
@@ -121,6 +182,26 @@ cursor.select("table", as_dataframe=True).to_csv()
 # Returns object list (accessible with attributes)
 cursor.select("table", model=Sample, as_model=True)
 
+# IMPORT / EXPORT #
+
+# Streams table rows into CSV / NDJSON files with fetchmany (whole table is never loaded).
+cursor.export_csv("sample", "./database/sample.csv", order_by="id")
+cursor.export_ndjson("sample", "./database/sample.ndjson")
+
+# Streams the exported CSV file (with header) into a new table in chunks.
+# The table is created from the model when missing and values are coerced by model columns.
+cursor.import_csv("sample_from_csv", "./database/sample.csv", model=Sample, chunk_size=10000)
+
+# Streams the exported newline delimited JSON file into a new table.
+# fast=True turns journaling/syncing off and rebuilds non-unique indexes after load (use for initial loads only,
+# chunks are committed as loaded so a failed load keeps its partial rows).
+cursor.import_ndjson("sample_from_ndjson", "./database/sample.ndjson", model=Sample, fast=True)
+
+# Inserts a DataFrame into a new table in chunks.
+cursor.import_dataframe(
+    "sample_from_dataframe", cursor.select("sample", as_dataframe=True), model=Sample
+)
+
 # UPDATE #
 
 # Updates the data matched with where condition.
@@ -131,12 +212,21 @@ cursor.update(
 # Updates all of the data with same value.
 cursor.update("sample", data=dict(price=10000), update_all=True)
 
+# Updates many rows with (where, data) pairs in a single transaction.
+cursor.update_many(
+    "sample",
+    [(dict(id=1), dict(price=5000)), (dict(id=2), dict(price=7500))],
+)
+
 
 # DELETE #
 
 # Deletes all of the data matched with where condition.
 cursor.delete("sample", where=dict(id=1, age=19))
 
+# Deletes all of the rows whose key column is in the given key list (single transaction).
+cursor.delete_many("sample", key_column="id", keys=[3, 4, 5])
+
 
 # Deletes all of the data in table.
 cursor.delete("sample", delete_all=True)
@@ -145,3 +235,38 @@ cursor.delete("sample", delete_all=True)
 
 # Drops specified table.
 cursor.drop("sample")
+
+### SHARDING ###
+
+
+@dataclass
+class ShardedSample(BaseModel):
+    id: ShardKey(int)
+    name: str
+    price: int
+
+
+# Partitions a logical table across 4 sqlite files by a stable hash of the ShardKey column.
+# Use ranges=[...] (sorted inclusive upper bounds, one less than databases) for range partitioning.
+sharded = ShardedMento([f"./database/shard_{i}.db" for i in range(4)])
+sharded.create("sharded_sample", model=ShardedSample)
+
+# Writes go to the row's shard, rows of different shards are written in parallel.
+sharded.insert("sharded_sample", data=dict(id=1, name="fswair", price=4250))
+sharded.insert_many("sharded_sample", [dict(id=i, name="fswair", price=i) for i in range(2, 100)])
+
+# Selects with the shard key in where hit one shard, others fan out concurrently and merge by order_by/limit.
+sharded.select("sharded_sample", where=dict(id=1))
+sharded.select("sharded_sample", filter=lambda price: price > 50, order_by="price desc", limit=10)
+sharded.update("sharded_sample", data=dict(price=0), where=dict(id=1))
+sharded.delete("sharded_sample", where=dict(id=1))
+
+# Markers nest in any order, a shard key can also be the primary key.
+@dataclass
+class ShardedPrimarySample(BaseModel):
+    id: PrimaryKey(ShardKey(int))
+    name: str
+
+
+sharded.create("sharded_primary_sample", model=ShardedPrimarySample)
+sharded.close()
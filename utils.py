@@ -1,12 +1,19 @@
+import csv
+import heapq
 import json
 import logging
+import multiprocessing
+import pickle
 import sqlite3
+from concurrent.futures import ProcessPoolExecutor
 from pandas import DataFrame
 from typing import Any, TypeAlias
 from re import search
 import typing
 from numpy import iterable
+from functools import cmp_to_key
 from inspect import signature
+from itertools import chain, groupby, islice
 from pydantic import BaseModel
 from pydantic.dataclasses import dataclass
 from .models import DefaultModel
@@ -24,14 +31,25 @@ class Column:
         match = search("(\w+)\s?\:(.+)", str(arg))
         self.has_unique_check = False
         self.unique_args = None
+        self.is_shard_key = False
+        self.is_fulltext = False
         if "UniqueMatch" in str(arg):
             self.unique_args = search("UniqueMatch\[(.+)\]", str(arg))[1].split("-")
             self.has_unique_check = bool(self.unique_args)
         if match:
             column, _type = match.groups()
-            if search("PrimaryKey", _type):
-                is_primary = True
-                _type = search(".+?~PrimaryKey-(.+)", _type)[1]
+            # Markers nest in any order, e.g. PrimaryKey(ShardKey(int)) -> ~PrimaryKey-ShardKey-int
+            _type = _type.strip().lstrip("~")
+            while marker := search("^(PrimaryKey|ShardKey|FullText)-(.+)", _type):
+                name, _type = marker.groups()
+                if name == "PrimaryKey":
+                    is_primary = True
+                elif name == "ShardKey":
+                    self.is_shard_key = True
+                else:
+                    self.is_fulltext = True
+            self.name = column.lower().strip()
+            self.type = _type.lower().strip()
             addition = "primary key" if is_primary else ""
             if unique_columns and column.lower().strip() in unique_columns:
                 addition = "UNIQUE"
@@ -42,6 +60,8 @@ class Column:
 
         else:
             self.arg = f"{self.alphanum(arg)} text"
+            self.name = self.alphanum(arg).lower()
+            self.type = "str"
 
         self.arg = self.arg.lower()
 
@@ -49,6 +69,22 @@ class Column:
         data = [letter for letter in arg if letter.isalnum()]
         return "".join(data)
 
+    def coerce(self, value: Any) -> Any:
+        """Convert a raw (text, json or dataframe) value to the column's python type."""
+        if value is None or value == "" or value != value:
+            return None
+        if self.type == "int":
+            if type(value) == str and not value.strip().lstrip("-").isdigit():
+                return int(float(value))
+            return int(value)
+        if self.type == "float":
+            return float(value)
+        if self.type == "bool":
+            # bool columns are text, stored as 'True' / 'False' like Mento.insert writes them.
+            return str(str(value).lower() in ("1", "true", "yes"))
+        return value if type(value) in (str, bytes) else str(value)
+
+
 class PrimaryKey:
     def __new__(self, _type: type) -> typing.TypeVar:
         """A PrimaryKey statement to set columns as PrimaryKey"""
@@ -56,6 +92,20 @@ class PrimaryKey:
         return typing.TypeVar(f"{type_base}", _type, bytes)
 
 
+class ShardKey:
+    def __new__(self, _type: type) -> typing.TypeVar:
+        """A ShardKey statement to route rows of a ShardedMento table by this column"""
+        type_base: str = f"{ShardKey.__name__}-{_type.__name__}"
+        return typing.TypeVar(f"{type_base}", _type, bytes)
+
+
+class FullText:
+    def __new__(self, _type: type = str) -> typing.TypeVar:
+        """A FullText statement to index columns with FTS5 (searchable with Mento.search)"""
+        type_base: str = f"{FullText.__name__}-{_type.__name__}"
+        return typing.TypeVar(f"{type_base}", _type, bytes)
+
+
 class UniqueMatch:
     def __new__(self, *args: typing.Iterable) -> typing.TypeVar:
         """A matching tool to set one or many columns as unique. (Multiple Primary Key)"""
@@ -243,6 +293,207 @@ class Static:
         return DataFrame(data_dict)
 
 
+class MaterializedView:
+    def __init__(
+        self,
+        mento: "Mento",
+        table: str,
+        aggregate: str = "count",
+        column: str = None,
+        group_by: str = None,
+    ):
+        """An aggregate over a tracked table. Built with one scan, then refresh applies only the change log deltas."""
+        if aggregate not in ("count", "sum", "avg"):
+            raise BaseException(f"Unsupported aggregate `{aggregate}`, use count, sum or avg.")
+        if aggregate != "count" and not column:
+            raise BaseException(f"Aggregate `{aggregate}` needs a column.")
+        self.mento = mento
+        self.table = table
+        self.aggregate = aggregate
+        self.column = column
+        self.group_by = group_by
+        self.groups: dict = dict()
+        self.build()
+
+    def build(self):
+        """Compute the aggregate from the table and remember the change log version it covers."""
+        connection = self.mento.connection
+        triggers = [f"{self.table}_changes_{operation}" for operation in ("insert", "update", "delete")]
+        tracked = connection.cursor().execute(
+            f"SELECT count(*) FROM sqlite_master WHERE type = 'trigger' AND name IN ({', '.join('?' * len(triggers))})",
+            triggers,
+        ).fetchone()[0]
+        if tracked != len(triggers):
+            raise BaseException(
+                f"Table `{self.table}` has no change log. Please create it with track_changes=True."
+            )
+        fetch = Fetch(connection.cursor(), table=self.table)
+        for name in (self.column, self.group_by):
+            if name and name not in fetch.columns:
+                raise BaseException(f"Your table has no column named `{name}`")
+
+        group = self.group_by or "NULL"
+        counted = f"count({self.column})" if self.column else "count(*)"
+        total = f"coalesce(sum({self.column}), 0)" if self.column else "0"
+        connection.commit()
+        # Scan and version are read in one transaction so no change is counted twice or missed.
+        connection.execute("BEGIN", auto_commit=False)
+        try:
+            rows = connection.execute(
+                f"SELECT {group}, count(*), {counted}, {total} FROM {self.table} GROUP BY {group}",
+                auto_commit=False,
+            ).fetchall()
+            self.version = self.mento.version(self.table)
+        finally:
+            connection.commit()
+        self.groups = {key: [size, count, total] for key, size, count, total in rows}
+
+    def apply(self, data: dict, sign: int):
+        key = data.get(self.group_by) if self.group_by else None
+        state = self.groups.setdefault(key, [0, 0, 0])
+        value = data.get(self.column) if self.column else None
+        state[0] += sign
+        if not self.column or value is not None:
+            state[1] += sign
+        if self.column and type(value) in (int, float):
+            state[2] += sign * value
+        if state[0] <= 0:
+            self.groups.pop(key)
+
+    def refresh(self) -> int:
+        """Apply changes recorded since the last refresh, returns the number of changes applied."""
+        applied = 0
+        for change in self.mento.changes(self.table, since=self.version):
+            if change["old"]:
+                self.apply(change["old"], -1)
+            if change["new"]:
+                self.apply(change["new"], 1)
+            self.version = change["version"]
+            applied += 1
+        return applied
+
+    def result(self, state: list) -> "int | float | None":
+        size, count, total = state
+        if self.aggregate == "count":
+            return count
+        if self.aggregate == "sum":
+            return total
+        return total / count if count else None
+
+    @property
+    def value(self):
+        """Current aggregate, a dict of group -> aggregate if group_by is set."""
+        if self.group_by:
+            return {key: self.result(state) for key, state in self.groups.items()}
+        return self.result(self.groups.get(None, [0, 0, 0]))
+
+
+scan_filter = None
+scan_patterns = None
+
+
+def init_scan_worker(filter: Lambda = None, patterns: str | list[str] = None):
+    """Process pool initializer, keeps the predicate in the worker for every scanned range."""
+    global scan_filter, scan_patterns
+    scan_filter = filter
+    scan_patterns = patterns
+
+
+def scan_range(task: tuple) -> list[tuple]:
+    """Scan one rowid range with a read-only connection, returns matched rows in order_by order."""
+    database, table, start, end, index, order_by = task
+    connection = MentoConnection(database, read_only=True)
+    try:
+        cursor = connection.cursor().execute(
+            f"SELECT * FROM {table} WHERE rowid BETWEEN ? AND ? ORDER BY {order_by}",
+            (start, end),
+        )
+        matches = list()
+        for row in cursor:
+            if scan_filter:
+                if scan_filter(row[index]):
+                    matches.append(row)
+            elif iterable(scan_patterns):
+                for regex in scan_patterns:
+                    if search(regex, str(row[index])):
+                        matches.append(row)
+        return matches
+    finally:
+        connection.close()
+
+
+def encode_blob(value: Any) -> Any:
+    """JSON can't hold BLOBs, they are exported and logged as {"blob": hex}."""
+    if type(value) == bytes:
+        return {"blob": value.hex()}
+    return value
+
+
+def decode_blob(value: Any) -> Any:
+    """Reverse of encode_blob, also accepts the JSON text written into CSV cells."""
+    if type(value) == str and value.startswith('{"blob": '):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return value
+    if type(value) == dict and list(value.keys()) == ["blob"]:
+        return bytes.fromhex(value["blob"])
+    return value
+
+
+def scan_fallback(reason: str) -> None:
+    """Warn that a parallel scan runs serially, returns None so callers fall back."""
+    logging.warning(f"Parallel scan is not possible ({reason}), scanning serially.")
+    return None
+
+
+def order_terms(order_by: Column = None) -> "list[tuple[str, bool]] | None":
+    """Parse order_by as [(column, descending), ...]. Returns None for expressions that can't be merged."""
+    terms = list()
+    for term in str(order_by).split(","):
+        words = term.split()
+        if not words or not search("^\\w+$", words[0]) or len(words) > 2:
+            return None
+        if len(words) == 2 and words[1].lower() not in ("asc", "desc"):
+            return None
+        terms.append((words[0].lower(), len(words) == 2 and words[1].lower() == "desc"))
+    return terms
+
+
+def scan_order(order_by: Column = None) -> "tuple[str, bool] | None":
+    """Parse order_by as (column, descending). Returns None for statements that can't be merged."""
+    if not order_by:
+        return None, False
+    terms = order_terms(order_by)
+    if not terms or len(terms) != 1:
+        return None
+    return terms[0]
+
+
+def order_key(terms: list[tuple[str, bool]]):
+    """A sort key comparing row dicts by every (column, descending) term like sqlite's ORDER BY."""
+
+    def compare(first: dict, second: dict) -> int:
+        for column, descending in terms:
+            a, b = sort_key(first.get(column)), sort_key(second.get(column))
+            if a != b:
+                return (1 if a > b else -1) * (-1 if descending else 1)
+        return 0
+
+    return cmp_to_key(compare)
+
+
+def sort_key(value: Any) -> tuple:
+    """Sort values like sqlite does: NULL < numbers < text < blob."""
+    if value is None:
+        return (0, 0)
+    if type(value) in (int, float):
+        return (1, value)
+    if type(value) == str:
+        return (2, value)
+    return (3, value)
+
+
 class Mento:
     def __init__(
         self,
@@ -263,18 +514,24 @@ class Mento:
         model: BaseModel = DefaultModel,
         exists_check: bool = True,
         unique_columns: list = [],
+        track_changes: bool = False,
     ):
-        """Create a table with your BaseModel."""
+        """Create a table with your BaseModel. track_changes records every insert/update/delete to the change log."""
         if not table:
             table = self.default_table
         if not model:
             model = self.check_model
         parameters = list(signature(model).parameters.values())
         columns = list()
+        fulltext_columns = list()
+        column_names = list()
         for param in parameters:
             column = Column(str(param), unique_columns=unique_columns)
             if not column.has_unique_check:
                 columns.append(column.arg)
+                column_names.append(column.name)
+            if column.is_fulltext:
+                fulltext_columns.append(column.name)
         create_query = ", ".join(columns)
         if exists_check:
             self.connection.execute(
@@ -286,6 +543,128 @@ class Mento:
             except:
                 self.drop(table)
                 self.create(table, model, exists_check)
+        if fulltext_columns:
+            self.create_fulltext(table, fulltext_columns)
+        if track_changes:
+            self.create_change_log(table, column_names)
+
+    def create_change_log(self, table: str = None, columns: list[str] = list()):
+        """Create triggers recording rowid, operation, version and row values of table into mento_changes."""
+        if not table:
+            table = self.default_table
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS mento_changes (version INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "tbl text, row_id int, operation text, old_data text, new_data text)",
+            auto_commit=False,
+        )
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS mento_changes_tbl ON mento_changes (tbl, version)",
+            auto_commit=False,
+        )
+        # JSON can't hold BLOBs, they are logged as {"blob": hex} and decoded back by changes().
+        encode = lambda row, column: (
+            f"'{column}', CASE WHEN typeof({row}.{column}) = 'blob' "
+            f"THEN json_object('blob', hex({row}.{column})) ELSE {row}.{column} END"
+        )
+        new_data = "json_object(" + ", ".join([encode("new", column) for column in columns]) + ")"
+        old_data = "json_object(" + ", ".join([encode("old", column) for column in columns]) + ")"
+        log_query = "INSERT INTO mento_changes (tbl, row_id, operation, old_data, new_data)"
+        triggers = dict(
+            insert=f"{log_query} VALUES ('{table}', new.rowid, 'insert', NULL, {new_data});",
+            update=f"{log_query} VALUES ('{table}', new.rowid, 'update', {old_data}, {new_data});",
+            delete=f"{log_query} VALUES ('{table}', old.rowid, 'delete', {old_data}, NULL);",
+        )
+        for operation, query in triggers.items():
+            self.connection.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {table}_changes_{operation} AFTER {operation.upper()} ON {table} BEGIN {query} END",
+                auto_commit=False,
+            )
+        self.connection.commit()
+
+    def changes(self, table: str = None, since: int = 0, chunk_size: int = 1000):
+        """Stream change log entries of table newer than since (a version) as dicts, oldest first."""
+        if not table:
+            table = self.default_table
+        cursor = self.connection.cursor().execute(
+            "SELECT version, row_id, operation, old_data, new_data FROM mento_changes "
+            "where tbl = ? and version > ? ORDER BY version",
+            (table, since),
+        )
+        while rows := cursor.fetchmany(chunk_size):
+            for version, rowid, operation, old_data, new_data in rows:
+                yield dict(
+                    version=version,
+                    rowid=rowid,
+                    operation=operation,
+                    old=self.decode_change(old_data),
+                    new=self.decode_change(new_data),
+                )
+
+    def decode_change(self, data: str = None) -> "dict | None":
+        if not data:
+            return None
+        return {column: decode_blob(value) for column, value in json.loads(data).items()}
+
+    def version(self, table: str = None) -> int:
+        """Latest change log version of table (0 if nothing was recorded)."""
+        if not table:
+            table = self.default_table
+        version = self.connection.cursor().execute(
+            "SELECT max(version) FROM mento_changes where tbl = ?", (table,)
+        ).fetchone()[0]
+        return version or 0
+
+    def materialize(
+        self,
+        table: str = None,
+        aggregate: str = "count",
+        column: str = None,
+        group_by: str = None,
+    ) -> "MaterializedView":
+        """Create an aggregate (count, sum, avg) over table that is updated incrementally from the change log."""
+        if not table:
+            table = self.default_table
+        return MaterializedView(self, table, aggregate, column, group_by)
+
+    def create_fulltext(self, table: str = None, columns: list[str] = list()):
+        """Create an FTS5 index ({table}_fts) over columns, kept in sync with table by triggers."""
+        if not table:
+            table = self.default_table
+        fts = f"{table}_fts"
+        exists = self.connection.cursor().execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (fts,)
+        ).fetchone()
+        if exists:
+            return
+
+        fts_columns = ", ".join(columns)
+        new_values = ", ".join([f"new.{column}" for column in columns])
+        old_values = ", ".join([f"old.{column}" for column in columns])
+        delete_query = f"INSERT INTO {fts}({fts}, rowid, {fts_columns}) VALUES ('delete', old.rowid, {old_values});"
+        insert_query = f"INSERT INTO {fts}(rowid, {fts_columns}) VALUES (new.rowid, {new_values});"
+        self.connection.execute(
+            f"CREATE VIRTUAL TABLE {fts} USING fts5({fts_columns}, content='{table}')",
+            auto_commit=False,
+        )
+        self.connection.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_insert AFTER INSERT ON {table} BEGIN {insert_query} END",
+            auto_commit=False,
+        )
+        self.connection.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_delete AFTER DELETE ON {table} BEGIN {delete_query} END",
+            auto_commit=False,
+        )
+        self.connection.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_update AFTER UPDATE ON {table} BEGIN {delete_query} {insert_query} END",
+            auto_commit=False,
+        )
+        self.rebuild_fulltext(table)
+
+    def rebuild_fulltext(self, table: str = None):
+        """Re-index all rows of table (needed after VACUUM, which may renumber rowids)."""
+        if not table:
+            table = self.default_table
+        self.connection.execute(f"INSERT INTO {table}_fts({table}_fts) VALUES ('rebuild')")
 
     def create_many(
         self, datas: dict = dict(user=DefaultModel), exists_check: bool = True
@@ -303,6 +682,7 @@ class Mento:
             table = self.default_table
         self.create(table, model=DefaultModel)
         self.connection.execute(f"DROP TABLE {table}")
+        self.connection.execute(f"DROP TABLE IF EXISTS {table}_fts")
 
     def insert(
         self, table: str = None, data: dict = dict(), check_model: BaseModel = None
@@ -418,8 +798,10 @@ class Mento:
         as_model: bool = False,
         as_dataframe: bool = False,
         as_json: bool = False,
+        workers: int = 0,
     ):
-        """Select matched or all columns as lists include Python dict or custom formats (Detailed in Tests)."""
+        """Select matched or all columns as lists include Python dict or custom formats (Detailed in Tests).
+        With workers > 1, filter/regexp scans are split by rowid ranges across a process pool."""
         config = dict(
             model=model, as_model=as_model, as_json=as_json, as_dataframe=as_dataframe
         )
@@ -467,6 +849,15 @@ class Mento:
             response = Static(fetch.all(), **config)
             return response.data
         else:
+            if workers > 1 and limit:
+                scan_fallback("limit is applied before filtering")
+            elif workers > 1:
+                matches = self.parallel_scan(
+                    from_table, filter, regexp, order_by, workers
+                )
+                if matches is not None:
+                    response = Static(matches, **config)
+                    return response.data
             if filter:
                 if not callable(filter):
                     raise self.exceptions.auto(
@@ -559,6 +950,413 @@ class Mento:
                     "Please add where statement or set delete_all as true to delete all rows."
                 )
 
+    def search(
+        self,
+        table: str = None,
+        query: str = None,
+        rank: bool = True,
+        limit: int = 0,
+        model: BaseModel = None,
+        as_model: bool = False,
+        as_dataframe: bool = False,
+        as_json: bool = False,
+    ):
+        """Search FullText columns with an FTS5 query, best matches first if rank is set."""
+        if not table:
+            table = self.default_table
+        if as_model and not model:
+            raise self.exceptions.auto(
+                "If you want to get models you have to specify data model."
+            )
+        fts = f"{table}_fts"
+        additions = f"ORDER BY {fts}.rank" if rank else ""
+        if limit > 0:
+            additions += f" LIMIT {int(limit)}"
+        cursor = self.connection.cursor().execute(
+            f"SELECT {table}.* FROM {fts} JOIN {table} ON {table}.rowid = {fts}.rowid where {fts} MATCH ? {additions}",
+            (query,),
+        )
+        fetch = Fetch(cursor)
+        response = Static(
+            fetch.all(),
+            model=model,
+            as_model=as_model,
+            as_json=as_json,
+            as_dataframe=as_dataframe,
+        )
+        return response.data
+
+    def update_many(
+        self, table: str = None, updates: list[tuple[dict, dict]] = list()
+    ) -> int:
+        """Update many rows with (where, data) pairs in a single transaction."""
+        if not table:
+            table = self.default_table
+
+        fetch = Fetch(self.connection.cursor(), table=table)
+        for where, data in updates:
+            if not where or not data:
+                raise BaseException("Unexpected request. Please check your inputs.")
+            for key in list(where.keys()) + list(data.keys()):
+                if key not in fetch.columns:
+                    raise BaseException(f"Your table has no column named `{key}`")
+
+        # Consecutive pairs with the same shape share one prepared statement.
+        shape = lambda pair: (tuple(pair[1].keys()), tuple(pair[0].keys()))
+        affected = 0
+        try:
+            for (set_keys, where_keys), group in groupby(updates, key=shape):
+                update_query = ", ".join([f"{key} = ?" for key in set_keys])
+                where_statement = " and ".join([f"{key} = ?" for key in where_keys])
+                parameters = [
+                    tuple(data.values()) + tuple(where.values())
+                    for where, data in group
+                ]
+                cursor = self.connection.executemany(
+                    f"UPDATE {table} SET {update_query} where {where_statement}",
+                    parameters,
+                    auto_commit=False,
+                )
+                affected += cursor.rowcount
+            self.connection.commit()
+        except sqlite3.Error:
+            self.connection.rollback()
+            raise
+        return affected
+
+    def delete_many(
+        self, table: str = None, key_column: str = None, keys: list = list()
+    ) -> int:
+        """Delete every row whose key column is in keys with a single joined statement."""
+        if not table:
+            table = self.default_table
+
+        fetch = Fetch(self.connection.cursor(), table=table)
+        if key_column not in fetch.columns:
+            raise BaseException(f"Your table has no column named `{key_column}`")
+
+        try:
+            self.connection.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS _mento_keys (key)", auto_commit=False
+            )
+            self.connection.execute("DELETE FROM temp._mento_keys", auto_commit=False)
+            self.connection.executemany(
+                "INSERT INTO temp._mento_keys VALUES (?)",
+                [(key,) for key in keys],
+                auto_commit=False,
+            )
+            cursor = self.connection.execute(
+                f"DELETE FROM {table} where {key_column} IN (SELECT key FROM temp._mento_keys)",
+                auto_commit=False,
+            )
+            affected = cursor.rowcount
+            self.connection.execute("DELETE FROM temp._mento_keys", auto_commit=False)
+            self.connection.commit()
+        except sqlite3.Error:
+            self.connection.rollback()
+            raise
+        return affected
+
+    def import_csv(
+        self,
+        table: str = None,
+        path: str = None,
+        model: BaseModel = None,
+        chunk_size: int = 10000,
+        fast: bool = False,
+        delimiter: str = ",",
+    ) -> int:
+        """Stream a CSV file (with header) into table in chunks."""
+        with open(path, newline="", encoding="utf-8") as file:
+            reader = csv.reader(file, delimiter=delimiter)
+            columns = [column.lower().strip() for column in next(reader, [])]
+            rows = (tuple(decode_blob(value) for value in row) for row in reader)
+            return self.bulk_insert(table, columns, rows, model, chunk_size, fast)
+
+    def import_ndjson(
+        self,
+        table: str = None,
+        path: str = None,
+        model: BaseModel = None,
+        chunk_size: int = 10000,
+        fast: bool = False,
+    ) -> int:
+        """Stream a newline delimited JSON file into table in chunks. Columns are the first record's keys,
+        a later record with other keys raises instead of losing its values."""
+        with open(path, encoding="utf-8") as file:
+            records = (
+                (
+                    number,
+                    {str(key).lower().strip(): decode_blob(value) for key, value in json.loads(line).items()},
+                )
+                for number, line in enumerate(file, start=1)
+                if line.strip()
+            )
+            first = next(records, None)
+            if first is None:
+                return 0
+            columns = list(first[1].keys())
+
+            def rows():
+                for number, record in chain([first], records):
+                    unknown = [key for key in record if key not in columns]
+                    if unknown:
+                        raise BaseException(
+                            f"Line {number} has keys not in the first record: {', '.join(unknown)}"
+                        )
+                    yield tuple(record.get(column) for column in columns)
+
+            return self.bulk_insert(table, columns, rows(), model, chunk_size, fast)
+
+    def import_dataframe(
+        self,
+        table: str = None,
+        dataframe: DataFrame = None,
+        model: BaseModel = None,
+        chunk_size: int = 10000,
+        fast: bool = False,
+    ) -> int:
+        """Insert a pandas DataFrame into table in chunks."""
+        columns = [str(column).lower().strip() for column in dataframe.columns]
+        rows = dataframe.itertuples(index=False, name=None)
+        return self.bulk_insert(table, columns, rows, model, chunk_size, fast)
+
+    def export_csv(
+        self,
+        table: str = None,
+        path: str = None,
+        chunk_size: int = 10000,
+        order_by: Column = None,
+        delimiter: str = ",",
+    ) -> int:
+        """Stream table rows into a CSV file (with header) without loading the whole table. BLOBs are written as {"blob": hex}."""
+        cursor = self.export_cursor(table, order_by)
+        count = 0
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file, delimiter=delimiter)
+            writer.writerow([column[0] for column in cursor.description])
+            while rows := cursor.fetchmany(chunk_size):
+                writer.writerows(
+                    [
+                        [json.dumps(encode_blob(value)) if type(value) == bytes else value for value in row]
+                        for row in rows
+                    ]
+                )
+                count += len(rows)
+        return count
+
+    def export_ndjson(
+        self,
+        table: str = None,
+        path: str = None,
+        chunk_size: int = 10000,
+        order_by: Column = None,
+    ) -> int:
+        """Stream table rows into a newline delimited JSON file without loading the whole table. BLOBs are written as {"blob": hex}."""
+        cursor = self.export_cursor(table, order_by)
+        columns = [column[0] for column in cursor.description]
+        count = 0
+        with open(path, "w", encoding="utf-8") as file:
+            while rows := cursor.fetchmany(chunk_size):
+                file.writelines(
+                    json.dumps({column: encode_blob(value) for column, value in zip(columns, row)}) + "\n"
+                    for row in rows
+                )
+                count += len(rows)
+        return count
+
+    def export_cursor(self, table: str = None, order_by: Column = None):
+        if not table:
+            table = self.default_table
+        additions = f"ORDER BY {order_by}" if order_by else ""
+        return self.connection.execute(f"SELECT * FROM {table} {additions}", auto_commit=False)
+
+    def bulk_insert(
+        self,
+        table: str = None,
+        columns: list[str] = list(),
+        rows: typing.Iterable[tuple] = (),
+        model: BaseModel = None,
+        chunk_size: int = 10000,
+        fast: bool = False,
+    ) -> int:
+        """Insert rows (tuples ordered as columns) with executemany, one chunk at a time.
+        If model is given, table is created when missing and values are coerced by the model's columns.
+        fast=True turns journaling and syncing off and rebuilds non-unique indexes after load (unsafe on crash).
+        Rollback is undefined without a journal, so fast loads commit every chunk and partial loads persist on error."""
+        if not table:
+            table = self.default_table
+        if not model:
+            model = self.check_model
+
+        coercers = None
+        if model:
+            self.create(table, model=model)
+            spec = dict()
+            for param in signature(model).parameters.values():
+                column = Column(str(param))
+                if not column.has_unique_check:
+                    spec[column.name] = column
+            coercers = [spec.get(column) for column in columns]
+
+        fetch = Fetch(self.connection.cursor(), table=table)
+        for column in columns:
+            if column not in fetch.columns:
+                raise BaseException(f"Your table has no column named `{column}`")
+
+        insert_query = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+        rows = iter(rows)
+        restore = self.fast_load(table) if fast else None
+        count = 0
+        try:
+            while chunk := list(islice(rows, chunk_size)):
+                if coercers:
+                    chunk = [
+                        tuple(
+                            coercer.coerce(value) if coercer else value
+                            for coercer, value in zip(coercers, row)
+                        )
+                        for row in chunk
+                    ]
+                self.connection.executemany(insert_query, chunk, auto_commit=False)
+                count += len(chunk)
+                if fast:
+                    self.connection.commit()
+            self.connection.commit()
+        except BaseException:
+            if fast:
+                self.connection.commit()
+            else:
+                self.connection.rollback()
+            raise
+        finally:
+            if restore:
+                restore()
+        return count
+
+    def fast_load(self, table: str = None):
+        """Switch to journal_mode=OFF / synchronous=OFF and drop non-unique table indexes. Returns a function to restore them.
+        Unique indexes are kept so duplicates are rejected while loading instead of breaking the rebuild."""
+        self.connection.commit()
+        cursor = self.connection.cursor()
+        journal_mode = cursor.execute("PRAGMA journal_mode").fetchone()[0]
+        synchronous = cursor.execute("PRAGMA synchronous").fetchone()[0]
+        indexes = cursor.execute(
+            "SELECT m.name, m.sql FROM sqlite_master m JOIN pragma_index_list(?) l ON l.name = m.name "
+            "WHERE m.type = 'index' AND m.sql IS NOT NULL AND l.\"unique\" = 0",
+            (table,),
+        ).fetchall()
+        cursor.execute("PRAGMA journal_mode = OFF")
+        cursor.execute("PRAGMA synchronous = OFF")
+        for name, _ in indexes:
+            cursor.execute(f"DROP INDEX {name}")
+        self.connection.commit()
+
+        def restore():
+            failed = list()
+            try:
+                self.connection.commit()
+                for _, sql in indexes:
+                    try:
+                        cursor.execute(sql)
+                    except sqlite3.Error as error:
+                        failed.append(f"{sql} ({error})")
+                self.connection.commit()
+            finally:
+                cursor.execute(f"PRAGMA journal_mode = {journal_mode}")
+                cursor.execute(f"PRAGMA synchronous = {synchronous}")
+            if failed:
+                raise BaseException(
+                    "Some indexes couldn't be rebuilt after fast load, please create them again: "
+                    + "; ".join(failed)
+                )
+
+        return restore
+
+    def parallel_scan(
+        self,
+        table: str = None,
+        filter: Lambda = None,
+        regexp: dict[str, str | list[str]] = None,
+        order_by: Column = None,
+        workers: int = 2,
+    ) -> "list[dict] | None":
+        """Evaluate filter/regexp over rowid ranges in worker processes, each with its own read-only connection.
+        Results keep rowid or order_by order. Logs a warning and returns None if the scan can't run in parallel (in-memory
+        database, multi column order_by or a predicate that can't be pickled, like a lambda), then callers should scan serially."""
+        if not table:
+            table = self.default_table
+        database = getattr(self.connection, "database", None)
+        if not database or database == ":memory:" or str(database).startswith("file:"):
+            return scan_fallback("in-memory or URI database")
+
+        order = scan_order(order_by)
+        if order is None:
+            return scan_fallback(f"order_by `{order_by}` is not a single column")
+        order_column, descending = order
+
+        fetch = Fetch(self.connection.cursor(), table=table)
+        if filter:
+            if not callable(filter):
+                raise self.exceptions.auto(
+                    "Filter must be lambda with one argument, also this filter is not callable."
+                )
+            filter_args = filter.__code__.co_varnames
+            if not filter_args:
+                raise self.exceptions.auto(
+                    "No argument supplied to filter. Please, specifiy column name as argument."
+                )
+            column, patterns = filter_args[0], None
+        else:
+            column = str(list(regexp.keys())[0]).lower()
+            patterns = regexp[column]
+        if column not in fetch.columns:
+            raise BaseException(f"Current table has no column named `{column}`.")
+        if order_column and order_column not in fetch.columns:
+            return scan_fallback(f"order_by `{order_by}` is not a table column")
+
+        self.connection.commit()
+        low, high = self.connection.execute(
+            f"SELECT min(rowid), max(rowid) FROM {table}", auto_commit=False
+        ).fetchone()
+        if low is None:
+            return []
+
+        # Platform default start method (fork is unsafe on macOS and in threaded hosts),
+        # so the predicate must be picklable: module level functions work, lambdas scan serially.
+        context = multiprocessing.get_context()
+        try:
+            pickle.dumps(filter)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return scan_fallback("filter can't be pickled, use a module level function instead of a lambda")
+
+        # A few ranges per worker so uneven ranges don't leave processes idle.
+        step = max(1, -(-(high - low + 1) // (workers * 4)))
+        ranges = [(start, start + step - 1) for start in range(low, high + 1, step)]
+        index = fetch.columns.index(column)
+        order_by = f"{order_column} {'DESC' if descending else 'ASC'}" if order_column else "rowid"
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=init_scan_worker,
+            initargs=(filter, patterns),
+        ) as executor:
+            results = list(
+                executor.map(
+                    scan_range,
+                    [(database, table, start, end, index, order_by) for start, end in ranges],
+                )
+            )
+
+        if order_column:
+            key_index = fetch.columns.index(order_column)
+            rows = heapq.merge(
+                *results, key=lambda row: sort_key(row[key_index]), reverse=descending
+            )
+        else:
+            rows = chain.from_iterable(results)
+        return [dict(zip(fetch.columns, row)) for row in rows]
+
     def regexp(self, pattern: str, string: str | bytes) -> bool:
         """If pattern has a match with given string, returns True, else return False."""
         match = search(pattern, str(string))